@@ -1,5 +1,6 @@
 from .data_fetcher import DataFetcher
 from .data_processor import DataProcessor
 from .post_process import Visualizer, Exporter
+from .rolling_buffer import RollingBuffer
 
-__all__ = ['DataFetcher', 'DataProcessor', 'PostProcess']
+__all__ = ['DataFetcher', 'DataProcessor', 'PostProcess', 'RollingBuffer']
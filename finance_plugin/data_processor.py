@@ -8,9 +8,12 @@ Classes:
     DataProcessor: Classe principale pour le calcul des indicateurs techniques
 """
 
+import numpy as np
 import pandas as pd
 import talib
 
+from .rolling_buffer import RollingBuffer
+
 class DataProcessor:
     """
     Calcule des indicateurs techniques sur des données financières.
@@ -78,3 +81,61 @@ class DataProcessor:
         self.processed_data = self.data
 
         return self.processed_data
+
+    @staticmethod
+    def update_indicators(buffer: RollingBuffer) -> RollingBuffer:
+        """
+        Calcule les indicateurs techniques pour la dernière barre d'un RollingBuffer.
+
+        Destinée aux sessions intraday de longue durée : les calculs sont effectués
+        sur une vue sans copie de la colonne 'Close' et seule la barre la plus récente
+        est mise à jour, les barres précédentes conservant les valeurs calculées lors
+        de leur arrivée. Les barres sans cours de clôture sont ignorées.
+
+        Note:
+            Les indicateurs sont recalculés sur la fenêtre courante uniquement : le RSI
+            et le MACD reprennent leur période de chauffe à partir de la première barre
+            de la fenêtre.
+
+        Args:
+            buffer: Tampon contenant au moins les colonnes 'Close' et celles des indicateurs
+
+        Returns:
+            RollingBuffer: Le tampon mis à jour
+
+        Raises:
+            ValueError: Si le tampon n'est pas valide, si la dernière barre n'a pas de cours
+                        de clôture ou si le nombre de cours de clôture valides est insuffisant
+        """
+        if not isinstance(buffer, RollingBuffer):
+            raise ValueError("Input data must be a RollingBuffer")
+
+        required_columns = ['Close', 'SMA_20', 'RSI_14', 'MACD', 'MACD_Signal', 'MACD_Hist']
+        for col in required_columns:
+            if col not in buffer.columns:
+                raise ValueError(f"RollingBuffer must contain a '{col}' column")
+
+        close_prices = buffer.view('Close')
+
+        if len(close_prices) == 0 or np.isnan(close_prices[-1]):
+            raise ValueError("Latest bar must have a valid 'Close' value")
+
+        # Comme dans calculate_indicators, les barres sans cours de clôture sont ignorées
+        valid = ~np.isnan(close_prices)
+        if not valid.all():
+            close_prices = close_prices[valid]
+
+        if len(close_prices) < 20:
+            raise ValueError("Not enough data points to calculate indicators")
+
+        buffer.set_last('SMA_20', talib.SMA(close_prices, timeperiod=20)[-1])
+
+        buffer.set_last('RSI_14', talib.RSI(close_prices, timeperiod=14)[-1])
+
+        macd, macd_signal, macd_hist = talib.MACD(close_prices)
+
+        buffer.set_last('MACD', macd[-1])
+        buffer.set_last('MACD_Signal', macd_signal[-1])
+        buffer.set_last('MACD_Hist', macd_hist[-1])
+
+        return buffer
@@ -13,7 +13,9 @@ Classes:
 import matplotlib.pyplot as plt
 import pandas as pd
 from matplotlib.dates import DateFormatter
-from typing import Optional
+from typing import Optional, Union
+
+from .rolling_buffer import RollingBuffer
 
 class Visualizer:
     """
@@ -28,7 +30,7 @@ class Visualizer:
     """
 
     @staticmethod
-    def plot_data(name: str, data: pd.DataFrame, title: Optional[str] = None) -> None:
+    def plot_data(name: str, data: Union[pd.DataFrame, RollingBuffer], title: Optional[str] = None) -> None:
         """
         Génère une visualisation complète des indicateurs techniques.
 
@@ -39,7 +41,7 @@ class Visualizer:
 
         Args:
             name: Nom de l'actif financier (ex: 'ETL.PA')
-            data: DataFrame contenant les données financières et les indicateurs calculés
+            data: DataFrame (ou RollingBuffer) contenant les données financières et les indicateurs calculés
             title: Titre personnalisé pour le graphique (optionnel)
 
         Raises:
@@ -50,6 +52,9 @@ class Visualizer:
             >>> Visualizer.plot_data('ETL.PA', processed_data)
         """
         # Validation des données d'entrée
+        if isinstance(data, RollingBuffer):
+            data = data.to_dataframe()
+
         if not isinstance(data, pd.DataFrame):
             raise ValueError("Data must be a pandas DataFrame")
 
@@ -119,12 +124,12 @@ class Exporter:
     """
 
     @staticmethod
-    def to_csv(data: pd.DataFrame, filename: str, **kwargs) -> None:
+    def to_csv(data: Union[pd.DataFrame, RollingBuffer], filename: str, **kwargs) -> None:
         """
         Exporte les données vers un fichier CSV.
 
         Args:
-            data: DataFrame contenant les données à exporter
+            data: DataFrame (ou RollingBuffer) contenant les données à exporter
             filename: Chemin du fichier de destination
             kwargs: Arguments supplémentaires pour pandas.to_csv()
 
@@ -136,6 +141,9 @@ class Exporter:
             >>> Exporter.to_csv(processed_data, 'financial_analysis.csv')
         """
         # Validation des entrées
+        if isinstance(data, RollingBuffer):
+            data = data.to_dataframe()
+
         if not isinstance(data, pd.DataFrame):
             raise ValueError("Data must be a pandas DataFrame")
 
@@ -158,12 +166,12 @@ class Exporter:
             raise Exception(f"Error exporting to CSV: {str(e)}")
 
     @staticmethod
-    def to_excel(data: pd.DataFrame, filename: str, **kwargs) -> None:
+    def to_excel(data: Union[pd.DataFrame, RollingBuffer], filename: str, **kwargs) -> None:
         """
         Exporte les données vers un fichier Excel.
 
         Args:
-            data: DataFrame contenant les données à exporter
+            data: DataFrame (ou RollingBuffer) contenant les données à exporter
             filename: Chemin du fichier de destination (doit se terminer par .xlsx)
             kwargs: Arguments supplémentaires pour pandas.to_excel()
 
@@ -177,6 +185,9 @@ class Exporter:
         if not filename.endswith('.xlsx'):
             raise ValueError("Filename must end with .xlsx for Excel export")
 
+        if isinstance(data, RollingBuffer):
+            data = data.to_dataframe()
+
         try:
             data.to_excel(filename, index=False, **kwargs)
         except Exception as e:
@@ -0,0 +1,258 @@
+"""
+Module de fenêtre glissante à capacité fixe pour les sessions intraday.
+
+Ce module fournit un tampon circulaire adossé à des tableaux numpy, destiné aux
+processus de longue durée qui reçoivent des barres OHLCV au fil de l'eau. La
+mémoire reste constante quelle que soit la durée de la session : une fois la
+capacité atteinte, chaque nouvelle barre remplace la plus ancienne.
+
+Classes:
+    RollingBuffer: Tampon circulaire pour les données OHLCV et les indicateurs techniques
+"""
+
+import numbers
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+INDICATOR_COLUMNS = ['SMA_20', 'RSI_14', 'MACD', 'MACD_Signal', 'MACD_Hist']
+
+
+class RollingBuffer:
+    """
+    Tampon circulaire à capacité fixe pour des barres OHLCV et leurs indicateurs.
+
+    Chaque colonne est stockée deux fois à la suite dans un tableau de taille
+    2 * capacity : chaque barre est écrite à la position i et à la position
+    i + capacity. La fenêtre courante est ainsi toujours une tranche contiguë du
+    tableau, ce qui permet de fournir des vues sans copie aux fonctions TA-Lib,
+    tout en conservant un ajout et une éviction en O(1).
+
+    Attributes:
+        capacity (int): Nombre maximal de barres conservées
+        columns (list): Noms des colonnes numériques stockées
+    """
+
+    def __init__(self, capacity: int, columns: Optional[Iterable[str]] = None):
+        """
+        Initialise un tampon vide.
+
+        Args:
+            capacity: Nombre maximal de barres conservées (doit être strictement positif)
+            columns: Colonnes numériques à stocker (par défaut OHLCV + indicateurs)
+
+        Raises:
+            ValueError: Si la capacité ou les colonnes ne sont pas valides
+        """
+        if not isinstance(capacity, numbers.Integral) or isinstance(capacity, bool) or capacity <= 0:
+            raise ValueError("Capacity must be a positive integer")
+
+        self.capacity = int(capacity)
+        self.columns = list(columns) if columns is not None else OHLCV_COLUMNS + INDICATOR_COLUMNS
+
+        if not self.columns:
+            raise ValueError("Buffer must contain at least one column")
+        if 'Date' in self.columns:
+            raise ValueError("'Date' is handled separately and cannot be a data column")
+        if len(set(self.columns)) != len(self.columns):
+            raise ValueError("Buffer columns must be unique")
+
+        self._index: Dict[str, int] = {col: i for i, col in enumerate(self.columns)}
+        # Une ligne par colonne : chaque série est contiguë en mémoire
+        self._values = np.full((len(self.columns), 2 * capacity), np.nan, dtype='float64')
+        self._dates = np.zeros(2 * capacity, dtype='datetime64[ns]')
+        self._tz = None
+        self._start = 0
+        self._size = 0
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame, capacity: int,
+                       columns: Optional[Iterable[str]] = None) -> 'RollingBuffer':
+        """
+        Crée un tampon à partir d'un DataFrame (ex: le résultat de DataFetcher.fetch_data()).
+
+        Seules les `capacity` dernières lignes sont conservées.
+
+        Args:
+            df: DataFrame contenant une colonne 'Date'
+            capacity: Nombre maximal de barres conservées
+            columns: Colonnes numériques à stocker (par défaut OHLCV + indicateurs)
+
+        Returns:
+            RollingBuffer: Tampon initialisé avec les données du DataFrame
+
+        Raises:
+            ValueError: Si le DataFrame n'est pas valide
+        """
+        buffer = cls(capacity, columns)
+        buffer.extend(df)
+        return buffer
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def is_full(self) -> bool:
+        """Indique si le tampon a atteint sa capacité maximale."""
+        return self._size == self.capacity
+
+    @property
+    def nbytes(self) -> int:
+        """Taille mémoire des tableaux sous-jacents, en octets (constante)."""
+        return self._values.nbytes + self._dates.nbytes
+
+    def append(self, date, **values: float) -> None:
+        """
+        Ajoute une barre en O(1), en évinçant la plus ancienne si le tampon est plein.
+
+        Les colonnes non renseignées sont initialisées à NaN.
+
+        Args:
+            date: Horodatage de la barre (tout format accepté par pd.Timestamp)
+            values: Valeurs des colonnes (ex: Open=100.0, Close=101.5)
+
+        Raises:
+            ValueError: Si une colonne inconnue est fournie, ou si l'horodatage mélange
+                        dates avec et sans fuseau horaire
+        """
+        unknown = set(values) - set(self._index)
+        if unknown:
+            raise ValueError(f"Unknown columns: {sorted(unknown)}")
+
+        row = np.full(len(self.columns), np.nan, dtype='float64')
+        for col, value in values.items():
+            row[self._index[col]] = value
+
+        timestamp = pd.Timestamp(date)
+        tz = timestamp.tz
+        self._check_tz(tz)
+        if tz is not None:
+            timestamp = timestamp.tz_convert('UTC').tz_localize(None)
+
+        # Toutes les conversions ont réussi : le tampon peut être modifié
+        if self._size == 0:
+            self._tz = tz
+        self._push(timestamp.to_datetime64(), row)
+
+    def extend(self, df: pd.DataFrame) -> None:
+        """
+        Ajoute toutes les lignes d'un DataFrame, dans l'ordre.
+
+        Seules les `capacity` dernières lignes sont lues. Les colonnes du DataFrame
+        absentes du tampon sont ignorées et les valeurs manquantes deviennent NaN.
+
+        Args:
+            df: DataFrame contenant une colonne 'Date'
+
+        Raises:
+            ValueError: Si le DataFrame n'est pas valide, ou si ses dates mélangent
+                        dates avec et sans fuseau horaire par rapport au tampon
+        """
+        if not isinstance(df, pd.DataFrame):
+            raise ValueError("Input data must be a pandas DataFrame")
+
+        if 'Date' not in df.columns:
+            raise ValueError("DataFrame must contain a 'Date' column")
+
+        # Seules les `capacity` dernières lignes peuvent rester dans le tampon
+        df = df.tail(self.capacity)
+        if df.empty:
+            return
+
+        dates = pd.to_datetime(df['Date'])
+        tz = dates.dt.tz
+        self._check_tz(tz)
+        if tz is not None:
+            dates = dates.dt.tz_convert('UTC').dt.tz_localize(None)
+        dates = dates.to_numpy(dtype='datetime64[ns]')
+
+        rows = np.full((len(df), len(self.columns)), np.nan, dtype='float64')
+        cols = [col for col in self.columns if col in df.columns]
+        if cols:
+            rows[:, [self._index[col] for col in cols]] = df[cols].to_numpy(dtype='float64', na_value=np.nan)
+
+        if self._size == 0:
+            self._tz = tz
+        for date, row in zip(dates, rows):
+            self._push(date, row)
+
+    def _check_tz(self, tz) -> None:
+        """Vérifie que le fuseau horaire est cohérent avec les barres déjà stockées."""
+        if self._size > 0 and (tz is None) != (self._tz is None):
+            raise ValueError("Cannot mix timezone-aware and naive timestamps in the same buffer")
+
+    def _push(self, date: np.datetime64, row: np.ndarray) -> None:
+        """Écrit une barre déjà convertie et met à jour la fenêtre, en O(1)."""
+        pos = (self._start + self._size) % self.capacity
+        mirror = pos + self.capacity
+
+        self._dates[pos] = self._dates[mirror] = date
+        self._values[:, pos] = self._values[:, mirror] = row
+
+        if self._size < self.capacity:
+            self._size += 1
+        else:
+            self._start = (self._start + 1) % self.capacity
+
+    def view(self, column: str) -> np.ndarray:
+        """
+        Retourne une vue contiguë, sans copie, d'une colonne sur la fenêtre courante.
+
+        La vue est en lecture seule et n'est valide que jusqu'au prochain ajout.
+
+        Args:
+            column: Nom de la colonne
+
+        Returns:
+            np.ndarray: Vue float64 contiguë, de la plus ancienne à la plus récente barre
+
+        Raises:
+            KeyError: Si la colonne n'existe pas
+        """
+        if column not in self._index:
+            raise KeyError(f"Unknown column: '{column}'")
+
+        window = self._values[self._index[column], self._start:self._start + self._size]
+        window.flags.writeable = False
+        return window
+
+    def set_last(self, column: str, value: float) -> None:
+        """
+        Modifie la valeur d'une colonne pour la barre la plus récente.
+
+        Utilisé pour enregistrer les indicateurs calculés sur la dernière barre.
+
+        Args:
+            column: Nom de la colonne
+            value: Nouvelle valeur
+
+        Raises:
+            KeyError: Si la colonne n'existe pas
+            ValueError: Si le tampon est vide
+        """
+        if column not in self._index:
+            raise KeyError(f"Unknown column: '{column}'")
+        if self._size == 0:
+            raise ValueError("Buffer is empty")
+
+        pos = (self._start + self._size - 1) % self.capacity
+        row = self._values[self._index[column]]
+        row[pos] = row[pos + self.capacity] = value
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Convertit la fenêtre courante en DataFrame (copie), pour Visualizer et Exporter.
+
+        Returns:
+            pd.DataFrame: DataFrame avec une colonne 'Date' suivie des colonnes du tampon
+        """
+        window = slice(self._start, self._start + self._size)
+        dates = pd.to_datetime(self._dates[window])
+        if self._tz is not None:
+            dates = dates.tz_localize('UTC').tz_convert(self._tz)
+
+        df = pd.DataFrame(self._values[:, window].T.copy(), columns=self.columns)
+        df.insert(0, 'Date', dates)
+        return df
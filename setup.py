@@ -7,6 +7,7 @@ setup(
     install_requires=[
         'openpyxl',
         'yfinance',
+        'numpy',
         'pandas',
         'matplotlib',
         'TA-Lib'
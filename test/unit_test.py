@@ -1,10 +1,12 @@
 import unittest
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from unittest.mock import patch
-from finance_plugin import DataFetcher, DataProcessor, Visualizer, Exporter
+from finance_plugin import DataFetcher, DataProcessor, Visualizer, Exporter, RollingBuffer
 import os
 import tempfile
+import tracemalloc
 
 class TestDataFetcher(unittest.TestCase):
     """Tests unitaires pour la classe DataFetcher"""
@@ -206,5 +208,169 @@ class TestExporter(unittest.TestCase):
         with self.assertRaises(ValueError):
             Exporter.to_excel(self.test_data, 'file.csv')
 
+class TestRollingBuffer(unittest.TestCase):
+    """Tests unitaires pour la classe RollingBuffer"""
+
+    def setUp(self):
+        """Préparation des données de test"""
+        self.test_data = pd.DataFrame({
+            'Date': pd.date_range('2025-09-01', periods=30, freq='min'),
+            'Close': np.arange(30, 60, dtype='float64'),
+            'Volume': np.arange(30, dtype='float64')
+        })
+
+    def test_append_and_evict(self):
+        """Test l'ajout de barres et l'éviction des plus anciennes"""
+        buffer = RollingBuffer.from_dataframe(self.test_data, capacity=10)
+
+        self.assertEqual(len(buffer), 10)
+        self.assertTrue(buffer.is_full)
+        np.testing.assert_array_equal(buffer.view('Close'), np.arange(50, 60))
+
+    def test_failed_append_leaves_buffer_unchanged(self):
+        """Test qu'un ajout en échec ne modifie pas le tampon"""
+        buffer = RollingBuffer.from_dataframe(self.test_data, capacity=3)
+        before = buffer.to_dataframe()
+
+        with self.assertRaises(ValueError):
+            buffer.append('2025-09-01 00:30', Close='abc')
+
+        pd.testing.assert_frame_equal(buffer.to_dataframe(), before)
+
+    def test_extend_nullable_and_tail(self):
+        """Test l'ajout d'un DataFrame avec valeurs manquantes nullable"""
+        data = self.test_data.copy()
+        data['Close'] = data['Close'].astype('Float64')
+        data.loc[29, 'Close'] = pd.NA
+        buffer = RollingBuffer.from_dataframe(data, capacity=5)
+
+        self.assertEqual(len(buffer), 5)
+        np.testing.assert_array_equal(buffer.view('Close'), [55.0, 56.0, 57.0, 58.0, np.nan])
+        self.assertEqual(list(buffer.to_dataframe()['Date']), list(data['Date'][-5:]))
+
+    def test_view_is_zero_copy(self):
+        """Test que les vues sont contiguës et partagent la mémoire du tampon"""
+        buffer = RollingBuffer.from_dataframe(self.test_data, capacity=7)
+        view = buffer.view('Close')
+
+        self.assertTrue(view.flags['C_CONTIGUOUS'])
+        self.assertTrue(np.shares_memory(view, buffer.view('Close')))
+        with self.assertRaises(ValueError):
+            view[0] = 0
+
+        # Une modification du tampon est visible dans une vue déjà obtenue
+        sma = buffer.view('SMA_20')
+        buffer.set_last('SMA_20', 42.0)
+        self.assertEqual(sma[-1], 42.0)
+
+    def test_to_dataframe(self):
+        """Test la conversion vers un DataFrame"""
+        buffer = RollingBuffer.from_dataframe(self.test_data, capacity=10)
+        df = buffer.to_dataframe()
+
+        self.assertEqual(list(df.columns), ['Date'] + buffer.columns)
+        self.assertEqual(list(df['Date']), list(self.test_data['Date'][-10:]))
+        self.assertTrue(df['Open'].isna().all())
+
+    def test_memory_is_flat(self):
+        """Test que la mémoire reste constante sur plusieurs jours de barres 1 minute"""
+        bars_per_day = 24 * 60
+        buffer = RollingBuffer(capacity=390)
+        dates = pd.date_range('2025-09-01', periods=4 * bars_per_day, freq='min', tz='Europe/Paris')
+
+        tracemalloc.start()
+        try:
+            # Premier jour : remplissage du tampon et allocations ponctuelles
+            for i, date in enumerate(dates[:bars_per_day]):
+                buffer.append(date, Close=float(i), Volume=1.0)
+            warm_up, _ = tracemalloc.get_traced_memory()
+
+            # Trois jours supplémentaires : la mémoire ne doit plus croître
+            for i, date in enumerate(dates[bars_per_day:], start=bars_per_day):
+                buffer.append(date, Close=float(i), Volume=1.0)
+            after, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # Une croissance linéaire représenterait au moins 3 * 1440 * 8 octets par colonne
+        self.assertLess(after - warm_up, 16 * 1024)
+        self.assertEqual(len(buffer), 390)
+        self.assertEqual(buffer.view('Close')[-1], float(len(dates) - 1))
+        self.assertEqual(buffer.to_dataframe()['Date'].iloc[-1], dates[-1])
+
+    def test_mixed_timezones(self):
+        """Test le refus de mélanger des dates avec et sans fuseau horaire"""
+        buffer = RollingBuffer(10)
+        buffer.append(pd.Timestamp('2025-09-01 10:00', tz='Europe/Paris'), Close=1.0)
+        with self.assertRaises(ValueError):
+            buffer.append('2025-09-01 10:01', Close=2.0)
+        buffer.append(pd.Timestamp('2025-09-01 08:02', tz='UTC'), Close=3.0)
+
+        naive = RollingBuffer(10)
+        naive.append('2025-09-01 10:00', Close=1.0)
+        with self.assertRaises(ValueError):
+            naive.append(pd.Timestamp('2025-09-01 10:01', tz='Europe/Paris'), Close=2.0)
+
+        dates = buffer.to_dataframe()['Date']
+        self.assertEqual(len(dates), 2)
+        self.assertEqual(dates.iloc[-1], pd.Timestamp('2025-09-01 10:02', tz='Europe/Paris'))
+
+    def test_set_last(self):
+        """Test la modification de la barre la plus récente"""
+        buffer = RollingBuffer.from_dataframe(self.test_data, capacity=10)
+        buffer.set_last('SMA_20', 42.0)
+
+        self.assertEqual(buffer.view('SMA_20')[-1], 42.0)
+        self.assertTrue(np.isnan(buffer.view('SMA_20')[:-1]).all())
+
+    def test_invalid_arguments(self):
+        """Test avec des paramètres invalides"""
+        with self.assertRaises(ValueError):
+            RollingBuffer(0)
+        with self.assertRaises(ValueError):
+            RollingBuffer(True)
+        with self.assertRaises(ValueError):
+            RollingBuffer(3, ['Close', 'Close'])
+        with self.assertRaises(ValueError):
+            RollingBuffer(10.0)
+        self.assertEqual(RollingBuffer(np.int64(10)).capacity, 10)
+
+        buffer = RollingBuffer(10)
+        with self.assertRaises(ValueError):
+            buffer.append('2025-09-01', Unknown=1.0)
+        with self.assertRaises(KeyError):
+            buffer.view('Unknown')
+        with self.assertRaises(ValueError):
+            buffer.set_last('Close', 1.0)
+
+    def test_update_indicators(self):
+        """Test le calcul des indicateurs sur la dernière barre du tampon"""
+        buffer = RollingBuffer.from_dataframe(self.test_data, capacity=25)
+        DataProcessor.update_indicators(buffer)
+
+        self.assertAlmostEqual(buffer.view('SMA_20')[-1], np.mean(np.arange(40, 60)))
+        self.assertFalse(np.isnan(buffer.view('RSI_14')[-1]))
+
+    def test_update_indicators_missing_close(self):
+        """Test le calcul des indicateurs avec des barres sans cours de clôture"""
+        buffer = RollingBuffer.from_dataframe(self.test_data, capacity=25)
+        buffer.append('2025-09-01 00:30', Volume=1.0)
+
+        with self.assertRaises(ValueError) as context:
+            DataProcessor.update_indicators(buffer)
+        self.assertIn("valid 'Close' value", str(context.exception))
+
+        buffer.append('2025-09-01 00:31', Close=60.0)
+        DataProcessor.update_indicators(buffer)
+        self.assertAlmostEqual(buffer.view('SMA_20')[-1], np.mean(np.arange(41, 61)))
+
+        short = RollingBuffer(25)
+        for i in range(20):
+            short.append(pd.Timestamp('2025-09-01') + pd.Timedelta(minutes=i),
+                         Close=float(i) if i % 2 else np.nan)
+        with self.assertRaises(ValueError) as context:
+            DataProcessor.update_indicators(short)
+        self.assertIn("Not enough data points", str(context.exception))
+
 if __name__ == '__main__':
     unittest.main()